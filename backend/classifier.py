@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+# Zero-shot classifier for event-name lines: needs only torch/transformers, no Selenium.
+# Off unless CLASSIFY_EVENT_NAMES=1, and only ever consulted by the page-text fallback;
+# the API path never calls it.
+
+import json
+import os
+import re
+import threading
+import urllib.request
+
+from parsing import DATE_PREFIX_RE, SKIP_RE, event_name_candidates, is_venue_line
+
+# ---------------- AI CLASSIFIER SETUP ----------------
+# Distilled MNLI is several times faster than bart-large-mnli for our 6 labels
+CLASSIFIER_MODEL = os.environ.get("CLASSIFIER_MODEL", "valhalla/distilbart-mnli-12-3")
+LABELS = ["event_name", "venue", "location", "promotional", "date", "unknown"]
+HYPOTHESIS_TEMPLATE = "This example is {}."
+CLASSIFIER_BATCH_SIZE = 32
+CLASSIFIER_MAX_LENGTH = 128
+CLASSIFIER_QUANTIZE = os.environ.get("CLASSIFIER_QUANTIZE") == "1"
+# Where CLASSIFIER_ONNX=1 keeps its one-time ONNX export of CLASSIFIER_MODEL
+CLASSIFIER_ONNX_DIR = os.environ.get("CLASSIFIER_ONNX_DIR") or os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "models", CLASSIFIER_MODEL.replace("/", "--") + "-onnx"
+)
+# e.g. http://127.0.0.1:8765/classify to use a running classifier_server.py
+CLASSIFIER_URL = os.environ.get("CLASSIFIER_URL")
+# Set CLASSIFY_EVENT_NAMES=1 to have the classifier vet event names in the page-text fallback
+CLASSIFY_EVENT_NAMES = os.environ.get("CLASSIFY_EVENT_NAMES") == "1"
+
+def _pair_template(tokenizer):
+    # Work out the special tokens the model wraps around a (premise, hypothesis) pair
+    # and, for BERT-style models, the segment ids that go with them
+    first = tokenizer("a", add_special_tokens=False)["input_ids"]
+    second = tokenizer("b", add_special_tokens=False)["input_ids"]
+    encoding = tokenizer("a", "b")
+    pair = encoding["input_ids"]
+    start = next(i for i in range(len(pair)) if pair[i:i + len(first)] == first)
+    end = next(i for i in range(len(pair) - len(second), -1, -1) if pair[i:i + len(second)] == second)
+    prefix, middle, suffix = pair[:start], pair[start + len(first):end], pair[end + len(second):]
+    if "token_type_ids" not in encoding:
+        return prefix, middle, suffix, None
+    types = encoding["token_type_ids"]
+    
+    def type_ids(premise_len, hypothesis_len):
+        return (types[:start] + [types[start]] * premise_len + types[start + len(first):end]
+                + [types[end]] * hypothesis_len + types[end + len(second):])
+    
+    return prefix, middle, suffix, type_ids
+
+def _entailment_id(config):
+    for label, label_id in config.label2id.items():
+        if label.lower().startswith("entail"):
+            return label_id
+    return -1
+
+def load_model():
+    # Imported here so runs the rules fully cover never pay for torch/transformers
+    import torch
+    from transformers import AutoModelForSequenceClassification, AutoTokenizer
+    
+    # Leave one core free for Chrome while the model runs on CPU
+    torch.set_num_threads(max(1, (os.cpu_count() or 1) - 1))
+    tokenizer = AutoTokenizer.from_pretrained(CLASSIFIER_MODEL)
+    # Set CLASSIFIER_ONNX=1 to run the model through ONNX Runtime (needs optimum[onnxruntime]).
+    # The first run exports the model and saves it; later runs load the saved export
+    if os.environ.get("CLASSIFIER_ONNX") == "1":
+        try:
+            from optimum.onnxruntime import ORTModelForSequenceClassification
+        except ImportError:
+            print("optimum not installed, falling back to PyTorch classifier")
+        else:
+            if os.path.isdir(CLASSIFIER_ONNX_DIR):
+                model = ORTModelForSequenceClassification.from_pretrained(
+                    CLASSIFIER_ONNX_DIR, provider="CPUExecutionProvider"
+                )
+            else:
+                print(f"Exporting {CLASSIFIER_MODEL} to ONNX in {CLASSIFIER_ONNX_DIR} (first run only)")
+                model = ORTModelForSequenceClassification.from_pretrained(
+                    CLASSIFIER_MODEL, export=True, provider="CPUExecutionProvider"
+                )
+                model.save_pretrained(CLASSIFIER_ONNX_DIR)
+            return tokenizer, model, "cpu"
+    if torch.cuda.is_available():
+        # bfloat16 on Ampere and newer, float16 on older cards
+        dtype = torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+        model = AutoModelForSequenceClassification.from_pretrained(CLASSIFIER_MODEL, dtype=dtype)
+        device = "cuda"
+    elif torch.backends.mps.is_available():
+        model = AutoModelForSequenceClassification.from_pretrained(CLASSIFIER_MODEL, dtype=torch.float16)
+        device = "mps"
+    else:
+        model = AutoModelForSequenceClassification.from_pretrained(CLASSIFIER_MODEL, dtype=torch.float32)
+        device = "cpu"
+        # Set CLASSIFIER_QUANTIZE=1 to run the Linear layers as int8 on CPU
+        if CLASSIFIER_QUANTIZE:
+            model = torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    return tokenizer, model.to(device).eval(), device
+
+def load_classifier():
+    import torch
+    
+    tokenizer, model, device = load_model()
+    
+    # LABELS never change, so template and tokenize the hypotheses once
+    hypothesis_ids = [
+        tokenizer(HYPOTHESIS_TEMPLATE.format(label), add_special_tokens=False)["input_ids"]
+        for label in LABELS
+    ]
+    prefix, middle, suffix, type_ids = _pair_template(tokenizer)
+    entailment_id = _entailment_id(model.config)
+    
+    @torch.inference_mode()
+    def classify(texts):
+        labels = []
+        for start in range(0, len(texts), CLASSIFIER_BATCH_SIZE):
+            batch = texts[start:start + CLASSIFIER_BATCH_SIZE]
+            premise_ids = tokenizer(
+                batch, add_special_tokens=False, truncation=True, max_length=CLASSIFIER_MAX_LENGTH
+            )["input_ids"]
+            pairs = [(premise, hypothesis) for premise in premise_ids for hypothesis in hypothesis_ids]
+            features = {"input_ids": [prefix + premise + middle + hypothesis + suffix for premise, hypothesis in pairs]}
+            if type_ids:
+                features["token_type_ids"] = [type_ids(len(premise), len(hypothesis)) for premise, hypothesis in pairs]
+            inputs = tokenizer.pad(features, return_tensors="pt")
+            logits = model(**{key: value.to(device) for key, value in inputs.items()}).logits
+            # Single-label zero-shot: the label whose hypothesis is most entailed wins
+            entailment = logits[:, entailment_id].reshape(len(batch), len(LABELS))
+            labels.extend(LABELS[index] for index in entailment.argmax(dim=1).tolist())
+        return labels
+    
+    # Warm up once so the first real batch doesn't pay for kernel setup
+    classify(["warmup"])
+    return classify
+
+def remote_classifier(url):
+    # Talks to classifier_server.py, which keeps the model resident between runs
+    def classify(texts):
+        request = urllib.request.Request(
+            url, data=json.dumps(texts).encode("utf-8"), headers={"Content-Type": "application/json"}
+        )
+        with urllib.request.urlopen(request, timeout=120) as response:
+            return json.load(response)
+    
+    return classify
+
+# Loaded lazily; scraper.scrape_city starts it before the page load so the two overlap
+classifier = None
+_classifier_ready = threading.Event()
+_classifier_thread = None
+_classifier_lock = threading.Lock()
+
+def _load_classifier_in_background():
+    global classifier
+    try:
+        classifier = remote_classifier(CLASSIFIER_URL) if CLASSIFIER_URL else load_classifier()
+    except Exception as e:
+        print(f"Zero-shot classifier failed to load: {e}")
+    finally:
+        _classifier_ready.set()
+
+def start_classifier_loading():
+    global _classifier_thread
+    with _classifier_lock:
+        if _classifier_thread is None:
+            _classifier_thread = threading.Thread(target=_load_classifier_in_background, daemon=True)
+            _classifier_thread.start()
+
+def wait_for_classifier():
+    start_classifier_loading()
+    _classifier_ready.wait()
+    if classifier is None:
+        raise RuntimeError("Zero-shot classifier failed to load")
+    return classifier
+
+CLASSIFIER_CACHE_SIZE = 4096
+
+# Venue names, locations and promo lines repeat all over the page, so remember model labels
+# keyed by the stripped, lowercased line
+_label_cache = {}
+
+# Cheap rules that settle the obvious lines before anything reaches the model
+RULES = [
+    (DATE_PREFIX_RE, 'date'),
+    (re.compile(r'^\d{1,2}:\d{2}\s*(AM|PM)', re.IGNORECASE), 'date'),
+    (SKIP_RE, 'promotional'),
+    (re.compile(r'(21|18|16)\+|All Ages|RSVP|Open Bar', re.IGNORECASE), 'promotional'),
+    (re.compile(r'\b(NY|Brooklyn|Manhattan|Queens)\b'), 'location'),
+]
+
+LOCATION_RE = re.compile(r',\s*(NY|New York)\b')
+WORD_RE = re.compile(r"[a-z0-9']+")
+PROMO_KWS = frozenset({"free", "rsvp", "buy", "ticket", "tickets", "presale", "giveaway"})
+VENUE_KWS = frozenset({"rooftop", "club", "hall", "room", "terminal", "warehouse", "pier", "stage", "lounge", "theater", "theatre", "center", "garden", "skydeck"})
+# Every keyword tagged with its category so a line's words are looked up in one pass
+KEYWORD_CATEGORIES = {**dict.fromkeys(VENUE_KWS, 'venue'), **dict.fromkeys(PROMO_KWS, 'promotional')}
+# Lines no rule recognises go to the zero-shot model; with this off they default to event_name
+USE_MNLI_FALLBACK = os.environ.get("USE_MNLI_FALLBACK", "1") == "1"
+
+def rule_label(text):
+    if is_venue_line(text):
+        return 'venue'
+    for rx, label in RULES:
+        if rx.search(text):
+            return label
+    categories = {KEYWORD_CATEGORIES.get(word) for word in WORD_RE.findall(text.lower())}
+    if '$' in text or 'promotional' in categories:
+        return 'promotional'
+    if LOCATION_RE.search(text):
+        return 'location'
+    if 'venue' in categories or " - " in text:
+        return 'venue'
+    return None
+
+def model_labels(texts):
+    # One classifier call for every line not labelled yet, so the model runs batched forward passes
+    keys = [text.strip().lower() for text in texts]
+    labels = {}
+    pending = {}
+    for key, text in zip(keys, texts):
+        if key in _label_cache:
+            labels[key] = _label_cache[key]
+        else:
+            pending.setdefault(key, text)
+    if pending and not USE_MNLI_FALLBACK:
+        labels.update(dict.fromkeys(pending, 'event_name'))
+    elif pending:
+        for key, label in zip(pending, wait_for_classifier()(list(pending.values()))):
+            labels[key] = label
+            if len(_label_cache) >= CLASSIFIER_CACHE_SIZE:
+                del _label_cache[next(iter(_label_cache))]
+            _label_cache[key] = label
+    return [labels[key] for key in keys]
+
+def classify_event_lines(texts):
+    # Rules see every distinct spelling, since they can be case-sensitive; the lines they
+    # can't settle go to the model in one batch
+    labels = {text: rule_label(text) for text in dict.fromkeys(texts)}
+    unsettled = [text for text, label in labels.items() if not label]
+    labels.update(zip(unsettled, model_labels(unsettled)))
+    return [labels[text] for text in texts]
+
+def classify_event_line(text):
+    return classify_event_lines([text])[0]
+
+def event_name_filter(lines):
+    # Label every look-back candidate in one batch; lines the model labels anything but
+    # event_name are skipped. The rules only bucket line types ("Techno Club Night" reads as
+    # a venue to them), so they never veto a name.
+    if not USE_MNLI_FALLBACK:
+        return None
+    candidates = event_name_candidates(lines)
+    if not candidates:
+        return None
+    try:
+        labels = dict(zip(candidates, model_labels(candidates)))
+    except Exception as e:
+        print(f"Classifier unavailable ({e}), keeping the plain look-back")
+        return None
+    print(f"🧠 Classified {len(candidates)} event name candidates")
+    return lambda line: labels.get(line, 'event_name') == 'event_name'
+# -----------------------------------------------------
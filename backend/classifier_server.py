@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+# Keeps the zero-shot model loaded so daily scrapes skip the model start-up cost.
+# Run it once, then start the scraper with CLASSIFY_EVENT_NAMES=1 CLASSIFIER_URL=http://127.0.0.1:8765/classify
+
+from http.server import BaseHTTPRequestHandler, HTTPServer
+import json
+import os
+
+from classifier import LABELS, load_classifier
+
+PORT = int(os.environ.get("CLASSIFIER_PORT", 8765))
+
+classify = load_classifier()
+
+class ClassifyHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        if self.path != "/classify":
+            self.send_error(404)
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            texts = json.loads(self.rfile.read(length))
+            labels = classify(list(texts))
+        except Exception as e:
+            self.send_error(400, str(e))
+            return
+        body = json.dumps(labels).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+def main():
+    # Single-threaded server: requests are classified one batch at a time
+    server = HTTPServer(("127.0.0.1", PORT), ClassifyHandler)
+    print(f"🧠 Classifier for {LABELS} listening on http://127.0.0.1:{PORT}/classify")
+    server.serve_forever()
+
+if __name__ == "__main__":
+    main()
@@ -1,32 +1,21 @@
 #!/usr/bin/env python3
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
-import time
 from datetime import datetime, date
 import re
+from driver_factory import get_driver, load_page, quit_driver, scroll_to_load_all
 
-def setup_driver():
-    chrome_options = Options()
-    chrome_options.add_argument("--headless")
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument("--window-size=1920,1080")
-    return webdriver.Chrome(options=chrome_options)
+DAY_LINE_RE = re.compile(r'^(Mon|Tue|Wed|Thu|Fri|Sat|Sun)')
 
 def debug_scrape():
-    driver = setup_driver()
+    # Shares the scraper's Chrome instead of starting a separately configured one
+    driver = get_driver()
     try:
         url = "https://edmtrain.com/new-york-city-ny"
         print(f"Loading {url}...")
-        driver.get(url)
-        time.sleep(5)
+        load_page(driver, url)
         
         # Scroll more to load content
-        for i in range(5):
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2)
+        scroll_to_load_all(driver, max_scrolls=5)
         
         # Get page text
         page_text = driver.find_element(By.TAG_NAME, "body").text
@@ -49,16 +38,18 @@ def debug_scrape():
         print(f"Patterns to search: {today_patterns}")
         
         lines = [line.strip() for line in page_text.split('\n') if line.strip()]
+        lines_lc = [line.lower() for line in lines]
+        # One alternation instead of a substring test per pattern
+        today_re = re.compile("|".join(re.escape(pattern) for pattern in today_patterns), re.IGNORECASE)
         
         # Find all date-like patterns
         date_lines = []
         for i, line in enumerate(lines):
-            if re.match(r'^(Mon|Tue|Wed|Thu|Fri|Sat|Sun)', line):
+            if DAY_LINE_RE.match(line):
                 date_lines.append((i, line))
             # Also look for any of our today patterns
-            for pattern in today_patterns:
-                if pattern.lower() in line.lower():
-                    print(f"FOUND POTENTIAL MATCH at line {i}: '{line}'")
+            if today_re.search(line):
+                print(f"FOUND POTENTIAL MATCH at line {i}: '{line}'")
         
         print(f"\nFound {len(date_lines)} date-like lines:")
         for i, (line_num, line) in enumerate(date_lines[:20]):  # Show first 20
@@ -66,15 +57,15 @@ def debug_scrape():
             
         # Show some context around potential matches
         print(f"\nSearching for Monday events...")
-        for i, line in enumerate(lines):
-            if "mon" in line.lower() and i < len(lines) - 5:
+        for i, (line, line_lc) in enumerate(zip(lines, lines_lc)):
+            if "mon" in line_lc and i < len(lines) - 5:
                 print(f"\nContext around line {i} ('{line}'):")
                 for j in range(max(0, i-2), min(len(lines), i+5)):
                     marker = ">>> " if j == i else "    "
                     print(f"{marker}{j}: {lines[j]}")
                     
     finally:
-        driver.quit()
+        quit_driver()
 
 if __name__ == "__main__":
     debug_scrape()
\ No newline at end of file
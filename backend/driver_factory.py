@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# Shared headless Chrome for scraper.py and the debug/test scripts
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, WebDriverException
+import urllib3
+import atexit
+import os
+import shutil
+
+# Resolved once per process; None lets Selenium Manager find a driver
+CHROMEDRIVER_PATH = os.environ.get("CHROMEDRIVER_PATH") or shutil.which("chromedriver")
+BLOCKED_URLS = ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.woff", "*.woff2", "*.ttf", "*.mp4", "*/analytics/*"]
+# A rendered date header ("Thu, Oct 1"); script, style and <head> text never count
+PAGE_CONTENT_XPATH = "//body//*[not(self::script or self::style)][{}]".format(" or ".join(
+    f"starts-with(normalize-space(text()), '{day}, ')" for day in ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+))
+
+def setup_driver():
+    chrome_options = Options()
+    chrome_options.add_argument("--headless")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--window-size=1920,1080")
+    # Hand control back at DOMContentLoaded; load_page waits for the content we need
+    chrome_options.page_load_strategy = "eager"
+    # Only the DOM and its text are read, so skip images and notification prompts
+    chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+    chrome_options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.default_content_setting_values.notifications": 2,
+    })
+    # A known chromedriver skips Selenium Manager's lookup on every launch
+    service = Service(executable_path=CHROMEDRIVER_PATH, log_output=os.devnull)
+    driver = webdriver.Chrome(service=service, options=chrome_options)
+    # Fonts, media and trackers never affect the listing text; CSS stays since lazy loading needs layout
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URLS})
+    return driver
+
+# What Selenium raises once Chrome is gone: WebDriverException from a dead browser, urllib3 and
+# connection errors when chromedriver itself has died
+BROWSER_GONE_ERRORS = (WebDriverException, urllib3.exceptions.HTTPError, ConnectionError)
+
+# One Chrome per process; starting Chromium is the biggest fixed cost of a scrape
+_DRIVER = None
+
+def get_driver():
+    global _DRIVER
+    if _DRIVER is None:
+        _DRIVER = setup_driver()
+    return _DRIVER
+
+def _quit_quietly(driver):
+    try:
+        driver.quit()
+    except BROWSER_GONE_ERRORS:
+        pass
+
+def quit_driver():
+    global _DRIVER
+    if _DRIVER is not None:
+        _quit_quietly(_DRIVER)
+        _DRIVER = None
+
+def reset_driver(driver):
+    # Stop the page and clear cookies between scrapes; False means the browser is gone
+    try:
+        driver.execute_script("window.stop();")
+        driver.delete_all_cookies()
+        return True
+    except BROWSER_GONE_ERRORS as e:
+        print(f"Browser session lost, starting a new one next time: {e}")
+        return False
+
+atexit.register(quit_driver)
+
+def load_page(driver, url):
+    driver.get(url)
+    try:
+        WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.XPATH, PAGE_CONTENT_XPATH)))
+    except TimeoutException:
+        print(f"Timed out waiting for content on {url}")
+
+# The whole scroll loop runs in the page: scroll, wait for the height to grow, nudge once
+# if it stalls, and stop early when stop_xpath matches. Resolves with the scroll count.
+SCROLL_JS = """
+const [maxScrolls, stopXPath, growMs, nudgeMs, done] = arguments;
+const found = () => stopXPath && document.evaluate(
+    stopXPath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+let scrolls = 0;
+const step = () => {
+    if (found() || scrolls >= maxScrolls) return done(scrolls);
+    const last = document.body.scrollHeight;
+    window.scrollTo(0, last);
+    const started = Date.now();
+    let nudged = false;
+    const wait = () => {
+        if (document.body.scrollHeight !== last) { scrolls++; return step(); }
+        const waited = Date.now() - started;
+        if (!nudged && waited > growMs) {
+            // Scroll up a bit, then back down a second later so scroll observers see both moves
+            nudged = true;
+            window.scrollTo(0, document.body.scrollHeight - 1000);
+            setTimeout(() => window.scrollTo(0, document.body.scrollHeight), 1000);
+        }
+        if (waited > growMs + nudgeMs) return done(scrolls);
+        setTimeout(wait, 100);
+    };
+    wait();
+};
+step();
+"""
+
+def scroll_to_load_all(driver, max_scrolls=10, stop_xpath=None, grow_timeout=5, nudge_timeout=3):
+    # Scroll more aggressively to load all events, in one WebDriver round trip
+    print("Scrolling to load more events...")
+    driver.set_script_timeout(max_scrolls * (grow_timeout + nudge_timeout) + 10)
+    scrolls = driver.execute_async_script(
+        SCROLL_JS, max_scrolls, stop_xpath, grow_timeout * 1000, nudge_timeout * 1000
+    )
+    print(f"Stopped after {scrolls} scrolls")
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+# Pure text parsing for EDMTrain listings: no Selenium, no classifier
+
+from collections import deque
+from datetime import datetime, timedelta
+from functools import lru_cache
+import re
+
+# ---------------- PRECOMPILED PATTERNS ----------------
+DATE_LINE_RE = re.compile(r'^(Mon|Tue|Wed|Thu|Fri|Sat|Sun),?\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{1,2})')
+DATE_PREFIX_RE = re.compile(r'^(Mon|Tue|Wed|Thu|Fri|Sat|Sun),?\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)')
+SKIP_RE = re.compile(r'buy tickets|sold out|tickets|venue directions|purchase', re.IGNORECASE)
+# The event-name look-back only ever skipped the ticket phrases
+TICKET_RE = re.compile(r'buy tickets|sold out|tickets', re.IGNORECASE)
+AGE_RE = re.compile(r'\s*(?:\b(?:21|18|16)\+|All Ages)\s*')
+VENUE_LOCATION_RE = re.compile(r' (?:NY|Brooklyn|Manhattan|Queens)')
+PROMO_LINES = frozenset(['new', 'open bar 8-9pm'])
+LINE_DATE, LINE_DATE_LIKE, LINE_SKIP, LINE_LINK, LINE_VENUE, LINE_PROMO, LINE_OTHER = (
+    "date", "date_like", "skip", "link", "venue", "promo", "other"
+)
+# Kinds the look-back may pick as an event name
+EVENT_NAME_KINDS = frozenset([LINE_LINK, LINE_OTHER])
+# -----------------------------------------------------
+
+def parse_date_string(date_str):
+    try:
+        date_str = date_str.strip()
+        current_year = datetime.now().year
+        return datetime.strptime(f"{date_str} {current_year}", "%a, %b %d %Y").date()
+    except Exception as e:
+        print(f"Error parsing date '{date_str}': {e}")
+        return None
+
+def build_week_matcher(today):
+    # Get this week's dates (7 days starting today)
+    week_dates = []
+    for i in range(0, 7):
+        target_date = today + timedelta(days=i)
+        week_dates.append(target_date)
+    
+    # Generate patterns for all dates in this week, mapped to their ISO date
+    week_patterns = []
+    pattern_to_iso = {}
+    for target_date in week_dates:
+        patterns = [
+            target_date.strftime("%a, %b %-d"),
+            target_date.strftime("%A, %B %-d"),
+            target_date.strftime("%a, %b %d"),
+            target_date.strftime("%A, %B %d"),
+            target_date.strftime("%b %-d"),
+            target_date.strftime("%b %d"),
+        ]
+        week_patterns.extend(patterns)
+        for pattern in patterns:
+            pattern_to_iso.setdefault(pattern.lower(), target_date.isoformat())
+    
+    # One alternation for the whole week; longest first so "Oct 14" wins over "Oct 1"
+    week_re = re.compile(
+        "(?:" + "|".join(re.escape(p) for p in sorted(pattern_to_iso, key=len, reverse=True)) + r")(?!\d)",
+        re.IGNORECASE,
+    )
+    
+    print(f"🗓️ Looking for THIS WEEK'S events: {[d.strftime('%a, %b %d') for d in week_dates]}")
+    print(f"Total patterns to match: {len(week_patterns)}")
+    return week_dates, week_re, pattern_to_iso
+
+def is_venue_line(line):
+    return " - " in line and VENUE_LOCATION_RE.search(line) is not None
+
+def location_for(text):
+    return "Brooklyn, NY" if 'Brooklyn' in text else "New York, NY"
+
+# Residencies repeat the same venue line week after week
+@lru_cache(maxsize=512)
+def split_venue_location(text):
+    # "Good Room 21+ - Brooklyn, NY" -> ("Good Room", "Brooklyn, NY") in one partition
+    venue_part, _, location_part = text.partition(' - ')
+    return AGE_RE.sub(' ', venue_part).strip(), location_for(location_part or venue_part)
+
+def line_kind(line):
+    # Every check a line needs, done once; the scan below only compares kinds
+    if DATE_LINE_RE.match(line):
+        return LINE_DATE
+    if DATE_PREFIX_RE.match(line):
+        return LINE_DATE_LIKE
+    if SKIP_RE.search(line):
+        # "Venue Directions" / "Purchase" lines never start an event, but the look-back can still pick them
+        return LINE_SKIP if TICKET_RE.search(line) or is_venue_line(line) else LINE_LINK
+    if is_venue_line(line):
+        return LINE_VENUE
+    if line.lower() in PROMO_LINES:
+        return LINE_PROMO
+    return LINE_OTHER
+
+def iter_lines(page_text):
+    # Stripped, non-empty lines of the rendered page, one at a time
+    for line in page_text.splitlines():
+        line = line.strip()
+        if line:
+            yield line
+
+def event_name_candidates(lines):
+    # Distinct lines the look-back below could pick as an event name, in page order
+    kinds = [line_kind(line) for line in lines]
+    candidates = {}
+    for i, kind in enumerate(kinds):
+        if kind != LINE_VENUE:
+            continue
+        for j in range(i - 1, max(i - 4, -1), -1):
+            if kinds[j] in EVENT_NAME_KINDS and len(lines[j]) > 3:
+                candidates.setdefault(lines[j])
+    return list(candidates)
+
+def iter_event_lines(lines, week_re, pattern_to_iso, today, is_event_name=None):
+    # Streams events out of the lines; only the three lines before the current one are kept.
+    # is_event_name, when given, can veto look-back candidates (e.g. classifier labels)
+    recent = deque(maxlen=3)
+    current_date = None
+    current_date_obj = None
+    
+    for line in lines:
+        kind = line_kind(line)
+        # Check if this line is a date
+        if kind == LINE_DATE:
+            # Check if this date is in our target week
+            week_match = week_re.search(line)
+            if week_match:
+                current_date = line
+                current_date_obj = pattern_to_iso[week_match.group(0).lower()]
+                print(f"📅 Found target date: {current_date}")
+            else:
+                # If we've processed events and hit a date outside our week, we can continue
+                current_date = None
+                current_date_obj = None
+        
+        # Only venue lines inside a target date section start an event
+        elif current_date and kind == LINE_VENUE:
+            venue_clean, location = split_venue_location(line)
+            
+            print(f"  🏢 {current_date} - Found venue: {venue_clean} in {location}")
+            
+            # Look backward (nearest first) over the three lines before the venue,
+            # skipping promo, ticket, venue and date lines
+            event_name = next(
+                (prev for prev_kind, prev in recent
+                 if prev_kind in EVENT_NAME_KINDS and len(prev) > 3 and (is_event_name is None or is_event_name(prev))),
+                None
+            )
+            
+            if event_name:
+                event = {
+                    "name": event_name,
+                    "venue": venue_clean,
+                    "location": location,
+                    "date": current_date_obj or today.isoformat()
+                }
+                print(f"    ✅ {event['name']} @ {event['venue']}")
+                yield event
+        
+        recent.appendleft((kind, line))
+
+def dedupe_events(events):
+    # Insertion-ordered dict keyed by (name, venue); the first occurrence wins
+    unique_events = {}
+    for event in events:
+        unique_events.setdefault((event['name'], event['venue']), event)
+    return list(unique_events.values())
+
+def parse_api_events(items, week_dates):
+    week_iso = {d.isoformat() for d in week_dates}
+    events = []
+    for item in items:
+        venue = item.get("venue") or {}
+        name = item.get("name") or ", ".join(artist["name"] for artist in item.get("artistList", []))
+        if item.get("date") not in week_iso or not name or not venue.get("name"):
+            continue
+        events.append({
+            "name": name,
+            "venue": venue["name"],
+            "location": venue.get("location") or location_for(venue["name"]),
+            "date": item["date"]
+        })
+    return events
+
+def parse_page_text(lines, today):
+    # Rendered page lines in, this week's unique events out
+    _, week_re, pattern_to_iso = build_week_matcher(today)
+    return dedupe_events(iter_event_lines(lines, week_re, pattern_to_iso, today))
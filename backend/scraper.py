@@ -1,218 +1,185 @@
 
 #!/usr/bin/env python3
-# ✅ UPDATED EDMTrain NYC Event Scraper using Hugging Face AI classifier for smart field parsing
+# ✅ UPDATED EDMTrain NYC Event Scraper: EDMTrain API first, rendered page text otherwise
 
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
+import aiohttp
 from selenium.webdriver.common.by import By
-import time
+import asyncio
 import json
-from datetime import datetime, date, timedelta
+from datetime import date, timedelta
 import os
-import re
-from transformers import pipeline
+import sys
 
-# ---------------- AI CLASSIFIER SETUP ----------------
-classifier = pipeline("zero-shot-classification", model="facebook/bart-large-mnli")
-LABELS = ["event_name", "venue", "location", "promotional", "date", "unknown"]
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def classify_event_line(text):
-    result = classifier(text, LABELS)
-    return result["labels"][0]
+from classifier import CLASSIFY_EVENT_NAMES, USE_MNLI_FALLBACK, event_name_filter, start_classifier_loading
+from driver_factory import get_driver, load_page, quit_driver, reset_driver, scroll_to_load_all
+from parsing import (
+    build_week_matcher, dedupe_events, iter_event_lines, iter_lines, parse_api_events,
+)
+
+# ---------------- PRECOMPILED PATTERNS ----------------
+EVENT_TEXT_SELECTOR = "[class*='event'], [class*='date']"
+EDMTRAIN_URL = "https://edmtrain.com/{city}"
+DEFAULT_CITY = "new-york-city-ny"
+EDMTRAIN_API_URL = "https://edmtrain.com/api/events"
+# Client key from edmtrain.com/api; without one the scraper renders the site with Selenium
+EDMTRAIN_API_KEY = os.environ.get("EDMTRAIN_API_KEY")
+# Also the list of supported cities: venue and location parsing only knows New York
+CITY_LOCATION_IDS = {DEFAULT_CITY: int(os.environ.get("EDMTRAIN_NYC_LOCATION_ID", 70))}
 # -----------------------------------------------------
 
-def setup_driver():
-    chrome_options = Options()
-    chrome_options.add_argument("--headless")
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument("--window-size=1920,1080")
-    return webdriver.Chrome(options=chrome_options)
+# Text of the outermost date/event containers only, so nav, footer and buttons never reach Python
+EVENT_TEXT_JS = """
+const nodes = Array.from(document.querySelectorAll(arguments[0]))
+    .filter(node => !node.parentElement || !node.parentElement.closest(arguments[0]));
+return nodes.map(node => node.innerText).join('\\n');
+"""
 
-def parse_date_string(date_str):
-    try:
-        date_str = date_str.strip()
-        current_year = datetime.now().year
-        return datetime.strptime(f"{date_str} {current_year}", "%a, %b %d %Y").date()
-    except Exception as e:
-        print(f"Error parsing date '{date_str}': {e}")
-        return None
+def extract_container_text(driver):
+    return driver.execute_script(EVENT_TEXT_JS, EVENT_TEXT_SELECTOR) or ""
 
-def scrape_edmtrain_nyc():
-    driver = setup_driver()
+def extract_body_text(driver):
+    return driver.find_element(By.TAG_NAME, "body").text
+
+def parse_page_lines(page_text, week_re, pattern_to_iso, today):
+    # Lazy from page text to events; only the classifier, which reads the lines twice
+    # (candidates, then the scan), needs them in a list
+    lines = iter_lines(page_text)
+    is_event_name = None
+    if CLASSIFY_EVENT_NAMES:
+        lines = list(lines)
+        is_event_name = event_name_filter(lines)
+    return iter_event_lines(lines, week_re, pattern_to_iso, today, is_event_name)
+
+def past_week_xpath(today):
+    # The listing is in date order, so once the day after our week renders we have the whole week
+    marker = (today + timedelta(days=7)).strftime("%a, %b %-d")
+    return f"//*[starts-with(normalize-space(text()), '{marker}')]"
+
+def scrape_city(city, today=None):
+    driver = get_driver()
     try:
-        url = "https://edmtrain.com/new-york-city-ny"
-        driver.get(url)
-        time.sleep(5)
-        
-        # Scroll more aggressively to load all events
-        print("Scrolling to load more events...")
-        last_height = driver.execute_script("return document.body.scrollHeight")
-        scroll_attempts = 0
-        max_scrolls = 10  # Increase max scrolls
-        
-        while scroll_attempts < max_scrolls:
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(3)  # Give more time for content to load
-            
-            new_height = driver.execute_script("return document.body.scrollHeight")
-            if new_height == last_height:
-                # Try scrolling up a bit then down again to trigger lazy loading
-                driver.execute_script("window.scrollTo(0, document.body.scrollHeight - 1000);")
-                time.sleep(1)
-                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)
-                
-                final_height = driver.execute_script("return document.body.scrollHeight")
-                if final_height == last_height:
-                    print(f"No more content after {scroll_attempts + 1} scrolls")
-                    break
-            
-            last_height = new_height
-            scroll_attempts += 1
-            print(f"Scroll {scroll_attempts}/{max_scrolls} - Page height: {new_height}")
-
-        page_text = driver.find_element(By.TAG_NAME, "body").text
-        lines = [line.strip() for line in page_text.split('\n') if line.strip()]
-        today = date.today()
-        
-        # Get this week's dates (7 days starting today)
-        week_dates = []
-        for i in range(0, 7):
-            target_date = today + timedelta(days=i)
-            week_dates.append(target_date)
-        
-        # Generate patterns for all dates in this week
-        week_patterns = []
-        for target_date in week_dates:
-            patterns = [
-                target_date.strftime("%a, %b %-d"),
-                target_date.strftime("%A, %B %-d"),
-                target_date.strftime("%a, %b %d"),
-                target_date.strftime("%A, %B %d"),
-                target_date.strftime("%b %-d"),
-                target_date.strftime("%b %d"),
-            ]
-            week_patterns.extend(patterns)
+        url = EDMTRAIN_URL.format(city=city)
+        today = today or date.today()
+        # The model may be needed for the page-text fallback; load it while Chrome fetches the page
+        if CLASSIFY_EVENT_NAMES and USE_MNLI_FALLBACK:
+            start_classifier_loading()
+        load_page(driver, url)
+        scroll_to_load_all(driver, stop_xpath=past_week_xpath(today))
         
-        print(f"🗓️ Looking for THIS WEEK'S events: {[d.strftime('%a, %b %d') for d in week_dates]}")
-        print(f"Total patterns to match: {len(week_patterns)}")
-        print(f"Total lines to scan: {len(lines)}")
-        events = []
-        current_date = None
-        current_date_obj = None
+        _, week_re, pattern_to_iso = build_week_matcher(today)
         
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
-            
-            # Check if this line is a date
-            date_match = re.match(r'^(Mon|Tue|Wed|Thu|Fri|Sat|Sun),?\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{1,2})', line)
-            if date_match:
-                # Check if this date is in our target week
-                if any(pattern.lower() in line.lower() for pattern in week_patterns):
-                    current_date = line
-                    # Find matching date object
-                    current_date_obj = None
-                    for target_date in week_dates:
-                        if any(pattern.lower() in line.lower() for pattern in [
-                            target_date.strftime("%a, %b %-d"),
-                            target_date.strftime("%A, %B %-d"),
-                            target_date.strftime("%a, %b %d"),
-                            target_date.strftime("%A, %B %d")
-                        ]):
-                            current_date_obj = target_date.isoformat()
-                            break
-                    if not current_date_obj:
-                        current_date_obj = today.isoformat()
-                    print(f"📅 Found target date: {current_date}")
-                else:
-                    # If we've processed events and hit a date outside our week, we can continue
-                    current_date = None
-                    current_date_obj = None
-                i += 1
-                continue
-            
-            # Only process events if we're in a target date section
-            if not current_date:
-                i += 1
-                continue
-            
-            # Skip empty lines and promotional content
-            if not line or len(line) < 3:
-                i += 1
-                continue
-            if any(skip in line.lower() for skip in ['buy tickets', 'sold out', 'tickets', 'venue directions', 'purchase']):
-                i += 1
-                continue
-            
-            # Check if this is a venue line
-            if " - " in line and any(loc in line for loc in [" NY", " Brooklyn", " Manhattan", " Queens"]):
-                venue_clean = line.split(' - ')[0].strip()
-                for age in ['21+', '18+', '16+', 'All Ages']:
-                    venue_clean = venue_clean.replace(age, '').strip()
-                location_part = line.split(' - ')[1].strip()
-                location = "Brooklyn, NY" if 'Brooklyn' in location_part else "New York, NY"
-                
-                print(f"  🏢 {current_date} - Found venue: {venue_clean} in {location}")
-                
-                # Look backward for the event name
-                event_name = None
-                for look_back in range(1, 4):
-                    if i - look_back >= 0:
-                        prev_line = lines[i - look_back].strip()
-                        
-                        # Skip promotional lines
-                        if prev_line.lower() in ['new', 'open bar 8-9pm'] or any(skip in prev_line.lower() for skip in ['buy tickets', 'sold out', 'tickets']):
-                            continue
-                        
-                        # Skip other venue lines
-                        if " - " in prev_line and any(loc in prev_line for loc in [" NY", " Brooklyn", " Manhattan", " Queens"]):
-                            continue
-                            
-                        # Skip date lines
-                        if re.match(r'^(Mon|Tue|Wed|Thu|Fri|Sat|Sun),?\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)', prev_line):
-                            continue
-                        
-                        # This should be our event
-                        if len(prev_line) > 3:
-                            event_name = prev_line
-                            break
-                
-                if event_name:
-                    event = {
-                        "name": event_name,
-                        "venue": venue_clean,
-                        "location": location,
-                        "date": current_date_obj or today.isoformat()
-                    }
-                    events.append(event)
-                    print(f"    ✅ {event['name']} @ {event['venue']}")
-            
-            i += 1
-
-        unique_events = []
-        seen = set()
-        for event in events:
-            key = (event['name'], event['venue'])
-            if key not in seen:
-                seen.add(key)
-                unique_events.append(event)
-        return unique_events
+        # Deduped as they stream in; the dict in dedupe_events is the only collection built
+        events = dedupe_events(parse_page_lines(extract_container_text(driver), week_re, pattern_to_iso, today))
+        if not events:
+            # The selector also matches stray classes (events-nav, *update*), so an empty
+            # result says nothing; scan the whole body like before
+            print("No events in the event containers, scanning the whole page")
+            events = dedupe_events(parse_page_lines(extract_body_text(driver), week_re, pattern_to_iso, today))
+
+        return events
     except Exception as e:
-        print(f"Error during scraping: {e}")
+        print(f"Error during scraping {city}: {e}")
         return []
     finally:
-        driver.quit()
+        # Leave the browser running for the next scrape, or drop it if it has died
+        if not reset_driver(driver):
+            quit_driver()
+
+def scrape_edmtrain_nyc():
+    return scrape_city(DEFAULT_CITY)
+
+async def fetch_events(session, location_id, week_dates):
+    params = {
+        "locationIds": location_id,
+        "startDate": week_dates[0].isoformat(),
+        "endDate": week_dates[-1].isoformat(),
+        "client": EDMTRAIN_API_KEY,
+    }
+    # aiohttp's response errors (raise_for_status, response.json) put the full URL, client key
+    # included, in their message, so only the status and our own text ever get raised
+    try:
+        async with session.get(EDMTRAIN_API_URL, params=params) as response:
+            if response.status != 200:
+                raise RuntimeError(f"EDMTrain API returned HTTP {response.status}")
+            body = await response.text()
+    except aiohttp.ClientResponseError as e:
+        raise RuntimeError(f"EDMTrain API request failed with HTTP {e.status}") from None
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        raise RuntimeError("EDMTrain API returned a response that is not JSON") from None
+    if not payload.get("success", True):
+        raise RuntimeError(payload.get("message", "EDMTrain API request failed"))
+    return payload.get("data", [])
+
+async def fetch_all_events(location_ids, week_dates):
+    timeout = aiohttp.ClientTimeout(total=30)
+    async with aiohttp.ClientSession(timeout=timeout) as session:
+        return await asyncio.gather(*(fetch_events(session, location_id, week_dates) for location_id in location_ids))
+
+def scrape_cities_api(cities, today):
+    # Event data straight from the JSON API: no browser, no scrolling, no text heuristics
+    week_dates, _, _ = build_week_matcher(today)
+    results = asyncio.run(fetch_all_events([CITY_LOCATION_IDS[city] for city in cities], week_dates))
+    return {city: dedupe_events(parse_api_events(items, week_dates)) for city, items in zip(cities, results)}
+
+def scrape_cities(cities, render=False):
+    unsupported = [city for city in cities if city not in CITY_LOCATION_IDS]
+    if unsupported:
+        raise ValueError(
+            f"Unsupported cities {unsupported}; venue and location parsing only handles {list(CITY_LOCATION_IDS)}"
+        )
+    # Each city once, in the order given
+    cities = list(dict.fromkeys(cities))
+    # One "today" for the whole run, so every city covers the same week even across midnight
+    today = date.today()
+    if not render and EDMTRAIN_API_KEY:
+        try:
+            return scrape_cities_api(cities, today)
+        except Exception as e:
+            print(f"EDMTrain API failed ({e}), rendering the pages with Selenium instead")
+    return {city: scrape_city(city, today=today) for city in cities}
+
+def write_events(path, events):
+    # orjson when installed, stdlib json otherwise. Both write raw UTF-8 with the same indented
+    # layout, so the file is byte-identical whichever one runs
+    if orjson is not None:
+        data = orjson.dumps(events, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(events, indent=2, ensure_ascii=False).encode("utf-8")
+    # Write beside the target and swap it in, so the API server never reads a half-written file
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
 
 def main():
     print("EDMTrain NYC Event Scraper")
-    events = scrape_edmtrain_nyc()
+    # --render skips the API and always scrapes the rendered site
+    args = sys.argv[1:]
+    render = "--render" in args
+    cities = [arg for arg in args if not arg.startswith("--")] or [DEFAULT_CITY]
+    try:
+        results = scrape_cities(cities, render=render)
+    except ValueError as e:
+        sys.exit(f"❌ {e}")
+    events = [event for city_events in results.values() for event in city_events]
     os.makedirs('data', exist_ok=True)
-    with open('data/latest_events.json', 'w') as f:
-        json.dump(events, f, indent=2)
+    write_events('data/latest_events.json', events)
     print(f"✅ Saved {len(events)} events to data/latest_events.json")
 
 if __name__ == "__main__":
-    main()
+    # --profile prints the 25 most expensive calls (cumulative time) after the run
+    if "--profile" in sys.argv:
+        import cProfile
+        import pstats
+        profiler = cProfile.Profile()
+        profiler.runcall(main)
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(25)
+    else:
+        main()
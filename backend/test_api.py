@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# Tests for the EDMTrain API client: cd backend && python -m unittest test_api
+
+import asyncio
+from datetime import date
+import unittest
+from unittest import mock
+
+import aiohttp
+
+import scraper
+
+SECRET = "client-key-123"
+WEEK = [date(2026, 10, 1), date(2026, 10, 7)]
+
+class StubResponse:
+    def __init__(self, status=200, body="", error=None):
+        self.status = status
+        self.body = body
+        self.error = error
+
+    async def __aenter__(self):
+        if self.error:
+            raise self.error
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def text(self):
+        return self.body
+
+class StubSession:
+    # Records the request and hands back one canned response
+    def __init__(self, response):
+        self.response = response
+        self.requests = []
+
+    def get(self, url, params=None):
+        self.requests.append((url, params))
+        return self.response
+
+def fetch(response):
+    session = StubSession(response)
+    with mock.patch.object(scraper, "EDMTRAIN_API_KEY", SECRET):
+        return asyncio.run(scraper.fetch_events(session, 70, WEEK)), session
+
+class FetchEventsTest(unittest.TestCase):
+    def assert_fails_without_key(self, response, message):
+        with self.assertRaises(RuntimeError) as ctx:
+            fetch(response)
+        self.assertIn(message, str(ctx.exception))
+        self.assertNotIn(SECRET, str(ctx.exception))
+        # Raised "from None", so the aiohttp error (and its URL) isn't chained either
+        self.assertIsNone(ctx.exception.__cause__)
+        self.assertTrue(ctx.exception.__suppress_context__)
+
+    def test_returns_event_data_and_sends_the_week(self):
+        data, session = fetch(StubResponse(body='{"success": true, "data": [{"id": 1}]}'))
+        self.assertEqual(data, [{"id": 1}])
+        url, params = session.requests[0]
+        self.assertEqual(url, scraper.EDMTRAIN_API_URL)
+        self.assertEqual(params, {
+            "locationIds": 70, "startDate": "2026-10-01", "endDate": "2026-10-07", "client": SECRET,
+        })
+
+    def test_http_error_status(self):
+        with self.assertRaises(RuntimeError) as ctx:
+            fetch(StubResponse(status=503, body="Service Unavailable"))
+        self.assertEqual(str(ctx.exception), "EDMTrain API returned HTTP 503")
+
+    def test_client_response_error_hides_the_url(self):
+        request_info = aiohttp.RequestInfo(
+            url=f"{scraper.EDMTRAIN_API_URL}?client={SECRET}", method="GET", headers={},
+            real_url=f"{scraper.EDMTRAIN_API_URL}?client={SECRET}",
+        )
+        error = aiohttp.ClientResponseError(request_info, (), status=502, message="Bad Gateway")
+        self.assertIn(SECRET, str(error))
+        self.assert_fails_without_key(StubResponse(error=error), "HTTP 502")
+
+    def test_html_body_hides_the_url(self):
+        self.assert_fails_without_key(StubResponse(body="<html>maintenance</html>"), "not JSON")
+
+    def test_api_reported_failure(self):
+        with self.assertRaises(RuntimeError) as ctx:
+            fetch(StubResponse(body='{"success": false, "message": "Invalid client key"}'))
+        self.assertEqual(str(ctx.exception), "Invalid client key")
+
+if __name__ == "__main__":
+    unittest.main()
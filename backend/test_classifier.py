@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# Tests for the optional event-name classifier: cd backend && python -m unittest test_classifier
+
+from contextlib import redirect_stdout
+from datetime import date
+import io
+import unittest
+from unittest import mock
+
+import classifier
+from parsing import build_week_matcher
+import scraper
+
+TODAY = date(2026, 10, 1)
+
+# Real names the line-type rules would call a location, a venue or a promo
+PAGE_TEXT = "\n".join([
+    "Thu, Oct 1",
+    "Brooklyn Night",
+    "Good Room 21+ - Brooklyn, NY",
+    "Techno Club Night",
+    "Marquee - New York, NY",
+    "Mamba Mondays - Bruce Wayne",
+    "Good Room 21+ - Brooklyn, NY",
+    "Open Bar Party",
+    "Elsewhere - Brooklyn, NY",
+])
+NAMES = [
+    ("Brooklyn Night", "Good Room"),
+    ("Techno Club Night", "Marquee"),
+    ("Mamba Mondays - Bruce Wayne", "Good Room"),
+    ("Open Bar Party", "Elsewhere"),
+]
+
+def stub_classifier(labels=None, calls=None):
+    # Stands in for the model: every line is an event name unless labels says otherwise
+    def classify(texts):
+        if calls is not None:
+            calls.append(list(texts))
+        return [(labels or {}).get(text, 'event_name') for text in texts]
+    return lambda: classify
+
+class ParsePageLinesTest(unittest.TestCase):
+    def setUp(self):
+        for patcher in [
+            mock.patch.object(scraper, "CLASSIFY_EVENT_NAMES", True),
+            mock.patch.object(classifier, "USE_MNLI_FALLBACK", True),
+            mock.patch.dict(classifier._label_cache, clear=True),
+        ]:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def parse(self):
+        with redirect_stdout(io.StringIO()):
+            _, week_re, pattern_to_iso = build_week_matcher(TODAY)
+            events = scraper.parse_page_lines(PAGE_TEXT, week_re, pattern_to_iso, TODAY)
+            return [(e["name"], e["venue"]) for e in events]
+
+    def test_rules_alone_keep_every_event(self):
+        with mock.patch.object(classifier, "USE_MNLI_FALLBACK", False):
+            self.assertEqual(self.parse(), NAMES)
+
+    def test_model_sees_every_candidate_in_one_call(self):
+        calls = []
+        with mock.patch.object(classifier, "wait_for_classifier", stub_classifier(calls=calls)):
+            self.assertEqual(self.parse(), NAMES)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(sorted(calls[0]), sorted(name for name, _ in NAMES))
+
+    def test_model_label_vetoes_a_name(self):
+        with mock.patch.object(classifier, "wait_for_classifier", stub_classifier({"Techno Club Night": "venue"})):
+            events = self.parse()
+        # The look-back moves on to the next candidate instead
+        self.assertNotIn(("Techno Club Night", "Marquee"), events)
+        self.assertIn(("Brooklyn Night", "Marquee"), events)
+
+    def test_unavailable_model_keeps_the_plain_look_back(self):
+        def fail():
+            raise RuntimeError("Zero-shot classifier failed to load")
+        with mock.patch.object(classifier, "wait_for_classifier", fail):
+            self.assertEqual(self.parse(), NAMES)
+
+class ClassifyEventLinesTest(unittest.TestCase):
+    def setUp(self):
+        for patcher in [
+            mock.patch.object(classifier, "USE_MNLI_FALLBACK", True),
+            mock.patch.dict(classifier._label_cache, clear=True),
+        ]:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def classify(self, texts, labels=None):
+        calls = []
+        with mock.patch.object(classifier, "wait_for_classifier", stub_classifier(labels, calls)):
+            return classifier.classify_event_lines(texts), calls
+
+    def test_labels_do_not_depend_on_input_order(self):
+        # The location rule is case-sensitive, so each spelling gets its own label
+        self.assertEqual(self.classify(["Brooklyn", "brooklyn"])[0], ["location", "event_name"])
+        classifier._label_cache.clear()
+        self.assertEqual(self.classify(["brooklyn", "Brooklyn"])[0], ["event_name", "location"])
+
+    def test_rules_win_over_cached_model_labels(self):
+        classifier._label_cache["brooklyn"] = "event_name"
+        labels, calls = self.classify(["Brooklyn", "Buy Tickets"])
+        self.assertEqual(labels, ["location", "promotional"])
+        self.assertEqual(calls, [])
+
+    def test_model_results_are_cached_by_normalised_text(self):
+        labels, calls = self.classify(["  Ghost Party ", "ghost party"], {"  Ghost Party ": "unknown"})
+        self.assertEqual(labels, ["unknown", "unknown"])
+        self.assertEqual(calls, [["  Ghost Party "]])
+        labels, calls = self.classify(["GHOST PARTY"])
+        self.assertEqual(labels, ["unknown"])
+        self.assertEqual(calls, [])
+
+    def test_cache_evicts_the_oldest_label(self):
+        with mock.patch.object(classifier, "CLASSIFIER_CACHE_SIZE", 2):
+            self.classify(["Ghost Party", "Afterglow", "Sunrise Set"])
+        self.assertEqual(list(classifier._label_cache), ["afterglow", "sunrise set"])
+
+    def test_without_the_model_unsettled_lines_are_event_names(self):
+        def fail():
+            raise AssertionError("the model should not be loaded")
+        with mock.patch.object(classifier, "USE_MNLI_FALLBACK", False), \
+                mock.patch.object(classifier, "wait_for_classifier", fail):
+            self.assertEqual(classifier.classify_event_lines(["Ghost Party", "Brooklyn"]), ["event_name", "location"])
+        self.assertEqual(classifier._label_cache, {})
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# Fixture tests for the page-text parser: cd backend && python -m unittest test_parsing
+
+from contextlib import redirect_stdout
+from datetime import date
+import io
+import unittest
+
+from parsing import build_week_matcher, parse_api_events, parse_page_text, split_venue_location
+
+TODAY = date(2026, 10, 1)  # Thursday; the week runs Oct 1 - Oct 7
+
+def parse(lines, today=TODAY):
+    # The parser narrates every match; keep the test output readable
+    with redirect_stdout(io.StringIO()):
+        return parse_page_text(lines, today)
+
+class ParsePageTextTest(unittest.TestCase):
+    def test_date_headers_map_to_iso_dates(self):
+        events = parse([
+            "Thu, Oct 1",
+            "Mamba Mondays: Bruce Wayne",
+            "Good Room 21+ - Brooklyn, NY",
+            "Sat, Oct 3",
+            "Kiss Kiss: CMD+JAZMINE",
+            "Marquee - New York, NY",
+        ])
+        self.assertEqual([e["date"] for e in events], ["2026-10-01", "2026-10-03"])
+
+    def test_oct_14_header_is_not_oct_1(self):
+        # "Oct 1" is in the week, but must not match the front of "Oct 14"
+        lines = [
+            "Wed, Oct 14",
+            "Late Show",
+            "Good Room - Brooklyn, NY",
+        ]
+        self.assertEqual(parse(lines), [])
+        events = parse(lines, today=date(2026, 10, 10))
+        self.assertEqual([e["date"] for e in events], ["2026-10-14"])
+
+    def test_events_outside_the_week_are_dropped(self):
+        events = parse([
+            "Thu, Oct 1",
+            "In Week",
+            "Good Room - Brooklyn, NY",
+            "Fri, Oct 9",
+            "Next Week",
+            "Marquee - New York, NY",
+        ])
+        self.assertEqual([e["name"] for e in events], ["In Week"])
+
+    def test_look_back_skips_promo_ticket_venue_and_date_lines(self):
+        events = parse([
+            "Thu, Oct 1",
+            "Ghost Party",
+            "NEW",
+            "Open Bar 8-9PM",
+            "Good Room - Brooklyn, NY",
+            "Buy Tickets",
+            "Sold Out",
+            "Marquee - New York, NY",
+            "Fri, Oct 2",
+            "Elsewhere - Brooklyn, NY",
+        ])
+        self.assertEqual(
+            [(e["name"], e["venue"]) for e in events],
+            [("Ghost Party", "Good Room")],
+        )
+
+    def test_look_back_only_skips_ticket_phrases(self):
+        events = parse([
+            "Thu, Oct 1",
+            "Free RSVP Rooftop Party",
+            "Good Room - Brooklyn, NY",
+            "Buy Now Pay Later Tour",
+            "Marquee - New York, NY",
+        ])
+        self.assertEqual(
+            [e["name"] for e in events],
+            ["Free RSVP Rooftop Party", "Buy Now Pay Later Tour"],
+        )
+
+    def test_purchase_lines_never_start_an_event(self):
+        events = parse([
+            "Thu, Oct 1",
+            "Warehouse Rave",
+            "Purchase - Brooklyn, NY",
+        ])
+        self.assertEqual(events, [])
+
+    def test_age_tag_is_stripped_from_venue(self):
+        self.assertEqual(split_venue_location("Good Room 21+ - Brooklyn, NY"), ("Good Room", "Brooklyn, NY"))
+        self.assertEqual(split_venue_location("Marquee All Ages - New York, NY"), ("Marquee", "New York, NY"))
+
+    def test_location_defaults_to_new_york(self):
+        events = parse([
+            "Thu, Oct 1",
+            "Brooklyn Night",
+            "Good Room 21+ - Brooklyn, NY",
+            "Manhattan Night",
+            "Marquee 18+ - Manhattan NY",
+        ])
+        self.assertEqual(
+            [(e["venue"], e["location"]) for e in events],
+            [("Good Room", "Brooklyn, NY"), ("Marquee", "New York, NY")],
+        )
+
+    def test_dedupe_keeps_first_occurrence(self):
+        events = parse([
+            "Thu, Oct 1",
+            "Residency",
+            "Good Room - Brooklyn, NY",
+            "Sat, Oct 3",
+            "Residency",
+            "Good Room - Brooklyn, NY",
+        ])
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0]["date"], "2026-10-01")
+
+class ParseApiEventsTest(unittest.TestCase):
+    def setUp(self):
+        with redirect_stdout(io.StringIO()):
+            self.week_dates, _, _ = build_week_matcher(TODAY)
+
+    def test_maps_api_items_to_events(self):
+        items = [
+            {"date": "2026-10-02", "name": "Ghost Party",
+             "venue": {"name": "Good Room", "location": "Brooklyn, NY"}},
+            # No event name: the lineup stands in for it
+            {"date": "2026-10-03", "name": None, "artistList": [{"name": "Bruce Wayne"}, {"name": "CMD"}],
+             "venue": {"name": "Marquee"}},
+        ]
+        self.assertEqual(parse_api_events(items, self.week_dates), [
+            {"name": "Ghost Party", "venue": "Good Room", "location": "Brooklyn, NY", "date": "2026-10-02"},
+            {"name": "Bruce Wayne, CMD", "venue": "Marquee", "location": "New York, NY", "date": "2026-10-03"},
+        ])
+
+    def test_skips_items_outside_the_week_or_incomplete(self):
+        items = [
+            {"date": "2026-10-09", "name": "Next Week", "venue": {"name": "Good Room"}},
+            {"date": "2026-10-02", "name": "", "artistList": [], "venue": {"name": "Good Room"}},
+            {"date": "2026-10-02", "name": "No Venue", "venue": None},
+        ]
+        self.assertEqual(parse_api_events(items, self.week_dates), [])
+
+if __name__ == "__main__":
+    unittest.main()
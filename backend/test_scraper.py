@@ -1,26 +1,15 @@
 #!/usr/bin/env python3
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
-import time
 from datetime import datetime, date
-
-def setup_driver():
-    chrome_options = Options()
-    chrome_options.add_argument("--headless")
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument("--window-size=1920,1080")
-    return webdriver.Chrome(options=chrome_options)
+from driver_factory import get_driver, load_page, quit_driver
 
 def test_scrape():
-    driver = setup_driver()
+    # Shares the scraper's Chrome instead of starting a separately configured one
+    driver = get_driver()
     try:
         url = "https://edmtrain.com/new-york-city-ny"
         print(f"Loading {url}...")
-        driver.get(url)
-        time.sleep(5)
+        load_page(driver, url)
         
         # Get page text
         page_text = driver.find_element(By.TAG_NAME, "body").text
@@ -37,7 +26,7 @@ def test_scrape():
                 print(f"{i}: {line.strip()}")
                 
     finally:
-        driver.quit()
+        quit_driver()
 
 if __name__ == "__main__":
     test_scrape()
\ No newline at end of file